@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Add real WebLogic CVE test rows to the sample Excel file for CVE sheet testing
+"""
+
+import os
+import sys
+from collections import defaultdict
+
+from openpyxl import load_workbook, Workbook
+
+# Real WebLogic CVEs from recent years for testing the CVE sheet creation,
+# as positional tuples in HEADER_ORDER column order, followed by severity
+# and a short description used for the printed summary
+HEADER_ORDER = ("AFFECTED_PLATFORMS", "XTRACT_PATH", "HOSTNAME", "CVE")
+REAL_WEBLOGIC_CVES = (
+    ("Windows Server 2019", "C:\\Oracle\\Middleware\\wlserver\\server\\lib\\weblogic.jar", "weblogic-server-01", "CVE-2020-14882", "Critical", "Console unauthenticated remote code execution"),
+    ("Linux", "/opt/oracle/middleware/wlserver/server/lib/weblogic.jar", "weblogic-server-02", "CVE-2017-10271", "High", "WLS Security wls-wsat XMLDecoder remote code execution"),
+    ("Windows Server 2022", "C:\\Oracle\\Middleware\\Oracle_Home\\wlserver\\server\\lib\\weblogic.jar", "weblogic-prod-01", "CVE-2024-20931", "Critical", "T3/IIOP remote code execution, CVE-2023-21839 patch bypass"),
+    ("Linux", "/opt/oracle/middleware/wlserver/server/lib/weblogic.jar", "weblogic-prod-02", "CVE-2024-21006", "High", "Core component remote exploit via T3/IIOP"),
+    ("Windows Server 2019", "C:\\Oracle\\Middleware\\wlserver_12.2\\server\\lib\\weblogic.jar", "weblogic-test-01", "CVE-2023-21839", "High", "Unauthenticated T3/IIOP remote access"),
+    ("Linux", "/u01/oracle/middleware/wlserver/server/lib/weblogic.jar", "weblogic-test-02", "CVE-2023-21931", "High", "Core component unauthenticated data access"),
+    ("Windows Server 2022", "C:\\Oracle\\Middleware\\wlserver\\server\\lib\\wls-api.jar", "weblogic-dev-01", "CVE-2023-22067", "Medium", "Core component vulnerability"),
+    ("Linux", "/opt/weblogic/wlserver/server/lib/weblogic.jar", "weblogic-stage-01", "CVE-2022-21371", "High", "Path traversal information disclosure"),
+    ("Windows Server 2019", "C:\\WebLogic\\wlserver\\server\\lib\\weblogic.jar", "weblogic-stage-02", "CVE-2022-21497", "High", "Web Services server-side request forgery"),
+    ("Linux", "/home/oracle/middleware/wlserver/server/lib/weblogic.jar", "weblogic-backup-01", "CVE-2022-39408", "Medium", "Server component vulnerability"),
+    ("Windows Server 2016", "C:\\Oracle\\Middleware\\wlserver_12.1\\server\\lib\\weblogic.jar", "weblogic-legacy-01", "CVE-2021-2109", "High", "Console JNDI injection remote code execution"),
+    ("Linux", "/opt/oracle/wlserver/server/lib/weblogic.jar", "weblogic-legacy-02", "CVE-2021-2394", "Critical", "T3/IIOP deserialization remote code execution"),
+    ("Windows Server 2019", "C:\\Oracle\\wlserver\\server\\lib\\wlthint3client.jar", "weblogic-cluster-01", "CVE-2021-35587", "Critical", "Access Manager OpenSSO agent pre-auth remote code execution"),
+    ("Linux", "/u01/app/oracle/middleware/wlserver/server/lib/weblogic.jar", "weblogic-cluster-02", "CVE-2020-2883", "Critical", "IIOP/T3 deserialization remote code execution"),
+    ("Windows Server 2016", "C:\\Oracle\\Middleware\\Oracle_Home\\wlserver\\server\\lib\\weblogic.jar", "weblogic-dmz-01", "CVE-2020-14750", "Critical", "Console remote code execution, CVE-2020-14882 patch bypass"),
+)
+
+def add_real_weblogic_cves():
+    excel_file = "./sample-data/sample.xlsx"
+
+    # Stream the existing workbook through openpyxl's optimized read-only and
+    # write-only modes instead of mutating the full in-memory workbook cell by
+    # cell. ws.append() bypasses the per-cell object construction of the
+    # regular mode, so rows go straight to the output stream.
+    src_wb = load_workbook(excel_file, read_only=True)
+    wb = Workbook(write_only=True)
+
+    headers = None
+    n_cols = 0
+    export_rows = 0
+    for src_sheet in src_wb.worksheets:
+        ws = wb.create_sheet(src_sheet.title)
+        append = ws.append  # bind once instead of an attribute lookup per row
+        is_export = src_sheet.title == "Export"
+        for row in src_sheet.iter_rows(values_only=True):
+            if is_export and headers is None:
+                headers = {name: idx for idx, name in enumerate(row) if name}
+            append(row)
+            if is_export:
+                export_rows += 1
+
+        if is_export:
+            # Append the new CVE rows, padding the unused output columns so
+            # existing column positions are preserved. The header->index
+            # mapping is resolved once up front instead of per cell.
+            n_cols = len(headers)
+            col_order = tuple(headers[k] for k in HEADER_ORDER)
+            for row_vals in REAL_WEBLOGIC_CVES:
+                new_row = [None] * n_cols
+                for col_idx, value in zip(col_order, row_vals):
+                    new_row[col_idx] = value
+                append(new_row)
+            export_rows += len(REAL_WEBLOGIC_CVES)
+
+    src_wb.close()
+
+    # Save to a temp file and swap it in atomically so a crash mid-save
+    # can't leave the sample workbook truncated
+    tmp_file = excel_file + ".tmp"
+    wb.save(tmp_file)
+    os.replace(tmp_file, excel_file)
+
+    print(f"Added {len(REAL_WEBLOGIC_CVES)} real WebLogic CVE test rows to {excel_file}")
+    print(f"Total rows in Export sheet: {export_rows}")
+    print(f"Total columns in Export sheet: {n_cols}")
+
+    # Summary grouped by CVE year, built from the same rows that were
+    # inserted and emitted in one write instead of ~30 print calls, so the
+    # printed list can't drift from the data
+    by_year = defaultdict(list)
+    for _, _, _, cve, severity, short_desc in REAL_WEBLOGIC_CVES:
+        by_year[cve.split("-")[1]].append(f"  - {cve}: {short_desc} ({severity})")
+
+    lines = ["", "Real WebLogic CVEs added:"]
+    for year in sorted(by_year, reverse=True):
+        lines.append(f"\n{year}:")
+        lines.extend(by_year[year])
+    lines.append("")
+    lines.append("Run the tool with cve.sheet.creation.enabled=true to fetch NVD data for these CVEs")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    add_real_weblogic_cves()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Check Weblogic detection results in the CVEs sheet
+"""
+
+from openpyxl import load_workbook
+
+# WebLogic CVEs with known in-the-wild exploitation
+_WEBLOGIC_TARGETS = frozenset(("CVE-2020-14882", "CVE-2017-10271"))
+
+def check_weblogic_cves():
+    excel_file = "./sample-data/sample.xlsx"
+
+    # Read-only mode streams rows instead of building the full workbook
+    # model - this script never writes, so the mutable tree is wasted work
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    if "CVEs" not in wb.sheetnames:
+        print("No CVEs sheet found - run the tool with cve.sheet.creation.enabled=true first")
+        return
+    cve_sheet = wb["CVEs"]
+
+    print("Weblogic CVEs found in the CVEs sheet:\n")
+
+    # Single pass: report Weblogic rows and accumulate the totals inline,
+    # so the sheet XML is only streamed once. values_only yields plain value
+    # tuples, so the counters run without per-cell proxies or .value access.
+    weblogic_y_count = 0
+    oracle_advisory_count = 0
+    for cve_id, _, _, _, weblogic_flag, oracle_advisories in cve_sheet.iter_rows(min_row=2, max_col=6, values_only=True):
+        oracle_adv_str = str(oracle_advisories) if oracle_advisories else ""
+        has_advisory = "oracle.com" in oracle_adv_str
+
+        if has_advisory:
+            oracle_advisory_count += 1
+
+        if weblogic_flag == "Y":
+            weblogic_y_count += 1
+            print(f"  {cve_id}")
+            if has_advisory:
+                print(f"    Advisories: {oracle_adv_str}")
+            if cve_id in _WEBLOGIC_TARGETS:
+                print("    (actively exploited in the wild)")
+
+    print(f"\nTotal Weblogic CVEs: {weblogic_y_count}")
+    print(f"Total CVEs with Oracle advisories: {oracle_advisory_count}")
+
+if __name__ == "__main__":
+    check_weblogic_cves()
@@ -3,11 +3,25 @@
 Create test data that matches current hostname for actual testing
 """
 
-import openpyxl
 from openpyxl import Workbook
 import os
 import socket
 
+HEADERS = ("AFFECTED_PLATFORMS", "XTRACT_PATH", "HOSTNAME", "CVE")
+
+# Absolute paths into the local test tree, resolved once instead of
+# re-formatting the base path into every row
+_BASE_PATH = os.path.abspath("test-linux-files")
+_PATHS = tuple(os.path.join(_BASE_PATH, rel) for rel in (
+    "usr/lib/jvm/java-8-openjdk/jre/lib/rt.jar",
+    "opt/tomcat/lib/catalina.jar",
+    "usr/share/java/log4j-core-2.14.1.jar",
+    "home/user/.wine/drive_c/Program Files/WinApp/app.exe",
+    "usr/bin/curl",
+    "invalid/path/does/not/exist.jar",
+    "usr/share/java/log4j-core-2.14.1.jar extra_garbage_data",
+))
+
 def create_hostname_matched_test():
     # Get current hostname (same as Java tool will get)
     try:
@@ -22,41 +36,35 @@ def create_hostname_matched_test():
     sheet.title = "Export"
 
     # Headers
-    headers = ["AFFECTED_PLATFORMS", "XTRACT_PATH", "HOSTNAME", "CVE"]
-    for i, header in enumerate(headers, 1):
-        sheet.cell(row=1, column=i, value=header)
-
-    # Get absolute paths to our test files
-    base_path = os.path.abspath("test-linux-files")
+    sheet.append(HEADERS)
 
     # Test data using current hostname but Linux platform
     # This simulates running the tool on a Linux machine with the current hostname
     test_data = [
         # JAR files - should be processed for version extraction
-        ["Linux", f"{base_path}/usr/lib/jvm/java-8-openjdk/jre/lib/rt.jar", current_hostname, "CVE-2022-1234"],
-        ["Linux", f"{base_path}/opt/tomcat/lib/catalina.jar", current_hostname, "CVE-2022-5678"],
-        ["Linux", f"{base_path}/usr/share/java/log4j-core-2.14.1.jar", current_hostname, "CVE-2021-44228"],
+        ("Linux", _PATHS[0], current_hostname, "CVE-2022-1234"),
+        ("Linux", _PATHS[1], current_hostname, "CVE-2022-5678"),
+        ("Linux", _PATHS[2], current_hostname, "CVE-2021-44228"),
 
         # EXE files - should be skipped for version processing because platform is Linux
-        ["Linux", f"{base_path}/home/user/.wine/drive_c/Program Files/WinApp/app.exe", current_hostname, "CVE-2022-9999"],
+        ("Linux", _PATHS[3], current_hostname, "CVE-2022-9999"),
 
         # Other file types
-        ["Linux", f"{base_path}/usr/bin/curl", current_hostname, "CVE-2022-2222"],
+        ("Linux", _PATHS[4], current_hostname, "CVE-2022-2222"),
 
         # Non-existent file
-        ["Linux", f"{base_path}/invalid/path/does/not/exist.jar", current_hostname, "CVE-2022-0000"],
+        ("Linux", _PATHS[5], current_hostname, "CVE-2022-0000"),
 
         # Invalid paths
-        ["Linux", "", current_hostname, "CVE-2022-3333"],
-        ["Linux", "N/A", current_hostname, "CVE-2022-4444"],
+        ("Linux", "", current_hostname, "CVE-2022-3333"),
+        ("Linux", "N/A", current_hostname, "CVE-2022-4444"),
 
         # Corrupted path (should trigger path fixing)
-        ["Linux", f"{base_path}/usr/share/java/log4j-core-2.14.1.jar extra_garbage_data", current_hostname, "CVE-2022-5555"],
+        ("Linux", _PATHS[6], current_hostname, "CVE-2022-5555"),
     ]
 
-    for i, row_data in enumerate(test_data, 2):
-        for j, value in enumerate(row_data, 1):
-            sheet.cell(row=i, column=j, value=value)
+    for row_data in test_data:
+        sheet.append(row_data)
 
     # Save test file
     test_file = "./sample-data/linux-hostname-test.xlsx"